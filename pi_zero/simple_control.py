@@ -8,9 +8,13 @@ import sys
 import time
 from winding_controller import WindingController, WindingParameters
 
-def print_status(controller):
+# The Pico pushes status up to 10x a second - the console only needs about one redraw a second
+STATUS_REDRAW_INTERVAL_S = 1.0
+
+def print_status(controller, progress=None):
     """Print current status"""
-    progress = controller.get_progress()
+    if progress is None:
+        progress = controller.get_progress()
     print(f"\n📊 Status: {progress['state'].upper()}")
     print(f"🔄 Turns: {progress['current_turns']}/{progress['target_turns']} ({progress['progress_percent']:.1f}%)")
     print(f"⚡ RPM: {progress['current_rpm']:.1f}")
@@ -25,12 +29,21 @@ def main():
     # Initialize controller with USB serial port
     controller = WindingController(port="/dev/tty.usbmodem314101")
     
-    # Add status callback
+    # Add status callback - the controller has already parsed the pushed line,
+    # so only redraw when something shown actually changed, at most once a second
+    # (the Pico re-sends an unchanged line every second, so the last change still shows)
+    last_progress = None
+    last_redraw = 0.0
     def status_callback(status_dict):
-        # Update controller state from status
-        if 'status' in status_dict:
-            controller._parse_status_response(status_dict['status'])
-        print_status(controller)
+        nonlocal last_progress, last_redraw
+        now = time.monotonic()
+        if now - last_redraw < STATUS_REDRAW_INTERVAL_S:
+            return
+        progress = controller.get_progress()
+        if progress != last_progress:
+            last_progress = progress
+            last_redraw = now
+            print_status(controller, progress)
     
     controller.add_status_callback(status_callback)
     
@@ -46,6 +59,24 @@ def main():
     # Start status monitoring
     controller.start_status_monitor()
     
+    # command -> (controller method, success message, failure message)
+    actions = {
+        "home": (controller.home_all_axes, "✅ Homing completed", "❌ Homing failed"),
+        "start": (controller.start_winding, "✅ Winding started", "❌ Failed to start winding"),
+        "pause": (controller.pause_winding, "⏸️ Winding paused", "❌ Failed to pause winding"),
+        "resume": (controller.resume_winding, "▶️ Winding resumed", "❌ Failed to resume winding"),
+        "stop": (controller.stop_winding, "⏹️ Winding stopped", "❌ Failed to stop winding"),
+        "emergency": (controller.emergency_stop, "🚨 EMERGENCY STOP ACTIVATED", "❌ Emergency stop failed"),
+        "reset": (controller.reset_emergency_stop, "🔄 Emergency stop reset", "❌ Failed to reset emergency stop"),
+    }
+    
+    # command -> helper that takes the controller and prints its own output
+    tools = {
+        "status": print_status,
+        "settings": change_settings,
+        "test": test_connection,
+    }
+    
     try:
         while True:
             print("\n" + "=" * 50)
@@ -67,49 +98,11 @@ def main():
             
             if cmd == "quit":
                 break
-            elif cmd == "home":
-                print("🏠 Homing all axes...")
-                if controller.home_all_axes():
-                    print("✅ Homing completed")
-                else:
-                    print("❌ Homing failed")
-            elif cmd == "start":
-                print("🔄 Starting winding...")
-                if controller.start_winding():
-                    print("✅ Winding started")
-                else:
-                    print("❌ Failed to start winding")
-            elif cmd == "pause":
-                if controller.pause_winding():
-                    print("⏸️ Winding paused")
-                else:
-                    print("❌ Failed to pause winding")
-            elif cmd == "resume":
-                if controller.resume_winding():
-                    print("▶️ Winding resumed")
-                else:
-                    print("❌ Failed to resume winding")
-            elif cmd == "stop":
-                if controller.stop_winding():
-                    print("⏹️ Winding stopped")
-                else:
-                    print("❌ Failed to stop winding")
-            elif cmd == "emergency":
-                if controller.emergency_stop():
-                    print("🚨 EMERGENCY STOP ACTIVATED")
-                else:
-                    print("❌ Emergency stop failed")
-            elif cmd == "reset":
-                if controller.reset_emergency_stop():
-                    print("🔄 Emergency stop reset")
-                else:
-                    print("❌ Failed to reset emergency stop")
-            elif cmd == "status":
-                print_status(controller)
-            elif cmd == "settings":
-                change_settings(controller)
-            elif cmd == "test":
-                test_connection(controller)
+            elif cmd in actions:
+                method, ok_message, fail_message = actions[cmd]
+                print(ok_message if method() else fail_message)
+            elif cmd in tools:
+                tools[cmd](controller)
             else:
                 print("❌ Unknown command")
                 
@@ -188,7 +181,7 @@ def test_connection(controller):
     
     # Test status
     print("4. Testing STATUS command...")
-    status = controller.get_status()
+    status = controller.get_live_status()
     if status:
         print(f"   ✅ Status: {status}")
     else:
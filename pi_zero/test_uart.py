@@ -4,11 +4,42 @@ UART Connection Test Script
 Tests basic UART communication with Pico
 """
 
+import os
 import serial
 import time
 import sys
+from winding_controller import WindingController
 
-def test_uart_connection(port="/dev/ttyUSB0", baudrate=115200):
+# Last port that answered, probed first on the next run
+LAST_PORT_FILE = os.path.expanduser("~/.cache/pico_winder/port")
+
+def load_last_port():
+    """Return the last working port, or None"""
+    try:
+        with open(LAST_PORT_FILE) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def save_last_port(port):
+    """Remember a working port for the next run"""
+    try:
+        os.makedirs(os.path.dirname(LAST_PORT_FILE), exist_ok=True)
+        with open(LAST_PORT_FILE, "w") as f:
+            f.write(port)
+    except OSError:
+        pass
+
+def read_reply(ser):
+    """Read one reply line, skipping STREAM: pushes a crashed session left running"""
+    deadline = time.monotonic() + ser.timeout
+    while time.monotonic() < deadline:
+        line = ser.readline().decode().strip()
+        if not line.startswith("STREAM:"):
+            return line
+    return ""
+
+def test_uart_connection(port="/dev/ttyUSB0", baudrate=230400):
     """Test UART connection with detailed diagnostics"""
     print("🔍 UART Connection Test")
     print("=" * 40)
@@ -19,8 +50,8 @@ def test_uart_connection(port="/dev/ttyUSB0", baudrate=115200):
     try:
         # Open serial connection
         print("1. Opening serial connection...")
-        ser = serial.Serial(port, baudrate, timeout=2.0)
-        time.sleep(2)  # Wait for Pico to initialize
+        # Replies arrive in a few ms - a short timeout keeps "no reply" cases quick
+        ser = serial.Serial(port, baudrate, timeout=WindingController.PING_TIMEOUT_S)
         print("   ✅ Serial port opened")
         
         # Clear buffers
@@ -37,16 +68,15 @@ def test_uart_connection(port="/dev/ttyUSB0", baudrate=115200):
         ser.reset_input_buffer()
         print("   ✅ Dummy message sent")
         
-        # Test ping command
+        # Test ping command - the Pico waits 2 s after power-up before starting
+        # its UART, so retry for as long as the controller does (6 x 0.5 s)
         print("4. Testing PING command...")
-        for attempt in range(3):
+        for attempt in range(WindingController.PING_ATTEMPTS):
             try:
                 ser.write(b"PING\n")
-                ser.flush()
-                time.sleep(0.2)
+                response = read_reply(ser)
                 
-                if ser.in_waiting > 0:
-                    response = ser.readline().decode().strip()
+                if response:
                     print(f"   Attempt {attempt + 1}: {response}")
                     if response == "PONG":
                         print("   ✅ PING successful!")
@@ -56,20 +86,16 @@ def test_uart_connection(port="/dev/ttyUSB0", baudrate=115200):
                     
             except Exception as e:
                 print(f"   Attempt {attempt + 1}: Error - {e}")
-            
-            time.sleep(0.5)
         else:
-            print("   ❌ PING failed after 3 attempts")
+            print(f"   ❌ PING failed after {WindingController.PING_ATTEMPTS} attempts")
             return False
         
         # Test version command
         print("5. Testing VERSION command...")
         ser.write(b"VERSION\n")
-        ser.flush()
-        time.sleep(0.2)
+        response = read_reply(ser)
         
-        if ser.in_waiting > 0:
-            response = ser.readline().decode().strip()
+        if response:
             print(f"   ✅ Version: {response}")
         else:
             print("   ❌ No version response")
@@ -77,11 +103,9 @@ def test_uart_connection(port="/dev/ttyUSB0", baudrate=115200):
         # Test status command
         print("6. Testing STATUS command...")
         ser.write(b"STATUS\n")
-        ser.flush()
-        time.sleep(0.2)
+        response = read_reply(ser)
         
-        if ser.in_waiting > 0:
-            response = ser.readline().decode().strip()
+        if response:
             print(f"   ✅ Status: {response}")
         else:
             print("   ❌ No status response")
@@ -112,12 +136,17 @@ def main():
         "/dev/serial0"
     ]
     
+    last_port = load_last_port()
+    if last_port:
+        ports_to_try = [last_port] + [p for p in ports_to_try if p != last_port]
+    
     success = False
     for port in ports_to_try:
         print(f"\n🔍 Trying port: {port}")
         try:
             if test_uart_connection(port):
                 success = True
+                save_last_port(port)
                 print(f"\n🎉 Success! Use port: {port}")
                 break
         except Exception as e:
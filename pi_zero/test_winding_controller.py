@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Tests for WindingController's serial reader: line framing, STREAM: routing
+and reply ordering, using a fake port instead of a Pico
+"""
+
+import queue
+import atexit
+import threading
+import time
+
+import pytest
+
+import winding_controller
+from winding_controller import WindingController
+
+
+class FakeSerial:
+    """Stands in for serial.Serial - replies are fed to the reader in fragments"""
+
+    def __init__(self, replies=None):
+        self.is_open = True
+        self.written = []
+        self.replies = replies or {}  # command -> list of byte chunks sent back
+        self._rx = queue.Queue()
+        self._pending = b""
+
+    def feed(self, *chunks):
+        """Queue bytes for the reader, one readinto() fragment per chunk"""
+        for chunk in chunks:
+            self._rx.put(chunk)
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        for command in bytes(data).decode().splitlines():
+            self.feed(*self.replies.get(command, [b"OK\n"]))
+        return len(data)
+
+    @property
+    def in_waiting(self):
+        return len(self._pending)
+
+    def readinto(self, buf):
+        if not self.is_open:
+            raise OSError("port closed")
+        if not self._pending:
+            chunk = self._rx.get()
+            if chunk is None:
+                return 0  # cancel_read()
+            self._pending = chunk
+        n = min(len(buf), len(self._pending))
+        buf[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def reset_input_buffer(self):
+        pass
+
+    def cancel_read(self):
+        self._rx.put(None)
+
+    def close(self):
+        self.is_open = False
+
+
+def make_controller(port, rx_buffer_size=None):
+    """Controller wired to a fake port with its reader thread running"""
+    controller = WindingController()
+    if rx_buffer_size:
+        controller.RX_BUFFER_SIZE = rx_buffer_size
+    controller.serial_conn = port
+    controller._start_reader()
+    controller.connected = True
+    return controller
+
+
+@pytest.fixture
+def port():
+    return FakeSerial()
+
+
+def wait_for(condition, timeout=1.0):
+    """Poll until condition() is true - the reader runs on its own thread"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_reply_split_across_reads():
+    """A reply arriving in several fragments is reassembled into one line"""
+    port = FakeSerial({"PING": [b"PO", b"N", b"G\n"]})
+    controller = make_controller(port)
+    try:
+        assert controller.send_command("PING", timeout=1.0) == "PONG"
+        assert port.written == [b"PING\n"]
+    finally:
+        controller.disconnect()
+
+
+def test_partial_line_moved_to_buffer_front(port):
+    """The tail after the last newline is kept and completed by the next read"""
+    controller = make_controller(port, rx_buffer_size=16)
+    try:
+        port.feed(b"OK one\nOK tw", b"o\nOK three\n")
+        assert controller.responses.get(timeout=1) == "OK one"
+        assert controller.responses.get(timeout=1) == "OK two"
+        assert controller.responses.get(timeout=1) == "OK three"
+    finally:
+        controller.disconnect()
+
+
+def test_full_buffer_without_newline_is_dropped(port):
+    """A buffer's worth of bytes with no newline is discarded, not wedged"""
+    controller = make_controller(port, rx_buffer_size=16)
+    try:
+        port.feed(b"X" * 16, b"\nOK\n")
+        assert controller.responses.get(timeout=1) == "OK"
+        assert controller.responses.empty()
+    finally:
+        controller.disconnect()
+
+
+def test_stream_line_updates_status_not_replies(port):
+    """STREAM: pushes are parsed and passed to callbacks, never queued as replies"""
+    controller = make_controller(port)
+    pushed = []
+    controller.add_status_callback(pushed.append)
+    try:
+        port.feed(b"STREAM: Spindle=12.5RPM(RUN) Trav", b"erse=3.25mm Turns=42 Homed=1\n")
+        assert wait_for(lambda: pushed)
+        assert controller.current_rpm == 12.5
+        assert controller.traverse_position == 3.25
+        assert controller.current_turns == 42
+        assert controller.homed.is_set()
+        assert pushed[0]["status"].startswith("STREAM:")
+        assert controller.responses.empty()
+    finally:
+        controller.disconnect()
+
+
+def test_send_commands_matches_replies_in_order():
+    """Replies map to commands in order, with a STREAM: push in between ignored"""
+    port = FakeSerial({
+        "M5": [b"OK M5\nSTREAM: Spindle=0.0RPM(STOP) Traverse=1.00mm Turns=7\n"],
+        "M999": [b"OK M9", b"99\n"],
+        "STATUS": [b"STATUS: Spindle=0.0RPM(STOP) Traverse=2.50mm Turns=9\n"],
+    })
+    controller = make_controller(port)
+    try:
+        responses = controller.send_commands(["M5", "M999", "STATUS"], timeout=1.0)
+        assert responses == [
+            "OK M5",
+            "OK M999",
+            "STATUS: Spindle=0.0RPM(STOP) Traverse=2.50mm Turns=9",
+        ]
+        assert port.written == [b"M5\nM999\nSTATUS\n"]
+        assert controller.current_turns == 9
+        assert controller.traverse_position == 2.5
+    finally:
+        controller.disconnect()
+
+
+def test_emergency_stop_replies_do_not_shift_later_replies():
+    """The out-of-band M112/M5 acks are dropped instead of answering the next command"""
+    port = FakeSerial({
+        "M112": [b"OK EMERGENCY_STOPPED\n"],
+        "STATUS": [b"STATUS: Spindle=0.0RPM(STOP) Traverse=0.00mm Turns=3\n"],
+    })
+    controller = make_controller(port)
+    try:
+        controller.emergency_stop()
+        responses = controller.send_commands(["M5", "M999", "STATUS"], timeout=1.0)
+        assert responses == [
+            "OK",
+            "OK",
+            "STATUS: Spindle=0.0RPM(STOP) Traverse=0.00mm Turns=3",
+        ]
+        assert controller.current_turns == 3
+    finally:
+        controller.disconnect()
+
+
+def test_live_status_round_trips_while_monitoring(port):
+    """get_status serves the fresh pushed line; get_live_status always sends STATUS"""
+    port.replies["STATUS"] = [b"STATUS: Spindle=0.0RPM(STOP) Traverse=0.00mm Turns=5\n"]
+    controller = make_controller(port)
+    controller.status_running = True
+    try:
+        port.feed(b"STREAM: Spindle=0.0RPM(STOP) Traverse=0.00mm Turns=4\n")
+        assert wait_for(lambda: controller.last_status_line)
+        assert controller.get_status() == {"status": controller.last_status_line}
+        assert port.written == []
+        
+        live = controller.get_live_status()
+        assert live == {"status": "STATUS: Spindle=0.0RPM(STOP) Traverse=0.00mm Turns=5"}
+        assert port.written == [b"STATUS\n"]
+    finally:
+        controller.status_running = False
+        controller.disconnect()
+
+
+def test_emergency_stop_during_command_keeps_its_reply():
+    """A command in flight when E-stop fires still gets its own reply, not the M112 ack"""
+    port = FakeSerial({"STATUS": [], "M112": [], "M5": [], "PING": [b"PONG\n"]})
+    controller = make_controller(port)
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(controller.send_command("STATUS", timeout=1.0)))
+    try:
+        waiter.start()
+        assert wait_for(lambda: port.written)
+        controller.emergency_stop()
+        # The Pico answers in the order it received the commands
+        port.feed(b"STATUS: Spindle=0.0RPM(RUN) Traverse=0.00mm Turns=8\n",
+                  b"OK EMERGENCY_STOPPED\n", b"OK\n")
+        waiter.join(timeout=2)
+        assert result == ["STATUS: Spindle=0.0RPM(RUN) Traverse=0.00mm Turns=8"]
+        assert controller.send_command("PING", timeout=1.0) == "PONG"
+    finally:
+        controller.disconnect()
+
+
+def test_unanswered_emergency_stop_stops_filtering():
+    """If the Pico stops answering after the M112 ack, later replies are not swallowed"""
+    port = FakeSerial({"M112": [b"OK EMERGENCY_STOPPED\n"], "M5": []})
+    controller = make_controller(port)
+    controller.ESTOP_REPLY_TIMEOUT_S = 0.05
+    try:
+        controller.emergency_stop()
+        time.sleep(0.1)
+        port.replies.clear()
+        assert controller.send_commands(["M5", "M999"], timeout=1.0) == ["OK", "OK"]
+    finally:
+        controller.disconnect()
+
+
+def test_connect_turns_off_leftover_stream(monkeypatch):
+    """connect() sends STREAM P0 when not monitoring, and the exit hook goes with disconnect()"""
+    port = FakeSerial({"PING": [b"PONG\n"]})
+    monkeypatch.setattr(winding_controller.serial, "Serial", lambda *args, **kwargs: port)
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(atexit, "unregister", registered.remove)
+    controller = WindingController()
+    
+    # A crashed session's push still arriving while we connect
+    port.feed(b"STREAM: Spindle=0.0RPM(STOP) Traverse=0.00mm Turns=2\n")
+    assert controller.connect()
+    assert port.written[-1] == b"STREAM P0\n"
+    assert registered == [controller.disconnect]
+    
+    controller.disconnect()
+    assert registered == []
@@ -4,10 +4,15 @@ winding_controller.py - FIXED VERSION
 Handles UART communication with Pico firmware
 """
 
+import atexit
+import os
+import re
 import serial
 import time
 import threading
-from typing import Optional, Dict, Any
+import queue
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
 @dataclass
@@ -19,6 +24,14 @@ class WindingParameters:
     winding_width_mm: float = 50.0
     start_position_mm: float = 20.0
 
+# Key=number fields in STATUS:/STREAM: lines, pulled out in one pass
+_STATUS_FIELD_RE = re.compile(r"(Spindle|Traverse|Turns|Homed)=(-?\d+(?:\.\d+)?)")
+
+@lru_cache(maxsize=64)
+def _encode_command(command: str) -> bytes:
+    """Encode a command line once - PING/STATUS/M5 etc. repeat constantly"""
+    return f"{command}\n".encode()
+
 class WindingState:
     IDLE = "IDLE"
     WINDING = "WINDING"
@@ -26,7 +39,25 @@ class WindingState:
     ERROR = "ERROR"
 
 class WindingController:
-    def __init__(self, port: str = "/dev/serial0", baudrate: int = 115200):
+    # Pico pushes "STREAM:" status lines at most this often (and only on change)
+    STREAM_INTERVAL_MS = 100
+    # Worst case: full 130mm travel at 20mm/s plus the 8mm back-off
+    HOMING_TIMEOUT_S = 15.0
+    # Replies nobody is waiting for (timed-out commands, stray errors) are dropped past this
+    RESPONSE_QUEUE_SIZE = 64
+    # Receive buffer, reused for the whole connection
+    RX_BUFFER_SIZE = 4096
+    # PONG comes back in a few ms; short attempts just keep asking while the Pico boots
+    PING_ATTEMPTS = 6
+    PING_TIMEOUT_S = 0.5
+    # The Pico re-sends an unchanged status line every second, so anything older means it stopped
+    STATUS_MAX_AGE_S = 1.5
+    # emergency_stop's M112/M5 replies arrive within ms; stop looking for them after this
+    ESTOP_REPLY_TIMEOUT_S = 1.0
+    # The firmware's reply to M112 - the next reply after it belongs to the paired M5
+    ESTOP_REPLY = "OK EMERGENCY_STOPPED"
+
+    def __init__(self, port: str = "/dev/serial0", baudrate: int = 230400):
         self.port = port
         self.baudrate = baudrate
         self.serial_conn = None
@@ -35,29 +66,49 @@ class WindingController:
         self.current_rpm = 0.0
         self.current_turns = 0
         self.traverse_position = 0.0
+        self.homed = threading.Event()
         self.connected = False
         
+        # Serial reader - routes pushed STREAM: lines vs. command replies
+        self.reader_thread = None
+        self.reader_running = False
+        self.responses = queue.Queue(maxsize=self.RESPONSE_QUEUE_SIZE)
+        self.command_lock = threading.Lock()
+        # Replies to emergency_stop's out-of-band M112/M5 that no caller waits for
+        self._estop_pending = 0  # M112 replies still expected
+        self._estop_m5_replies = 0  # M5 replies to drop (the line right after each M112 reply)
+        self._estop_deadline = 0.0
+        self._discard_lock = threading.Lock()
+        
         # Status monitoring
-        self.status_thread = None
         self.status_running = False
         self.status_callbacks = []
+        self.last_status_line = None
+        self.last_status_time = 0.0
 
     def connect(self) -> bool:
         """Connect to Pico via UART"""
         try:
-            self.serial_conn = serial.Serial(self.port, self.baudrate, timeout=2)
-            time.sleep(0.5)  # Let it settle
+            # No read timeout: the reader thread sleeps in select() until a byte
+            # arrives, and _stop_reader wakes it with cancel_read()
+            self.serial_conn = serial.Serial(self.port, self.baudrate, timeout=None)
+            self._enable_low_latency()
             
             # Send dummy message to stabilize UART
             self._send_dummy_message()
+            self._start_reader()
             
-            # Test connection
+            # Test connection - PING retries double as the wait for the Pico
             if self._test_connection():
                 self.connected = True
                 print(f"✅ Connected to Pico on {self.port}")
+                # Also turns off a push left running by a session that crashed
+                self._set_stream(self.STREAM_INTERVAL_MS if self.status_running else 0)
+                # Turn it off on the way out even if the caller never disconnects
+                atexit.register(self.disconnect)
                 return True
             else:
-                self.serial_conn.close()
+                self._stop_reader()
                 self.serial_conn = None
                 return False
                 
@@ -67,8 +118,12 @@ class WindingController:
 
     def disconnect(self):
         """Disconnect from Pico"""
-        if self.serial_conn and self.serial_conn.is_open:
-            self.serial_conn.close()
+        # Turn the push off so it doesn't outlive this session (the test
+        # scripts would read STREAM: lines as command replies)
+        atexit.unregister(self.disconnect)
+        if self.status_running and self.connected:
+            self._set_stream(0)
+        self._stop_reader()
         self.connected = False
         print("🔌 Disconnected from Pico")
 
@@ -76,84 +131,223 @@ class WindingController:
         """Send dummy message to stabilize UART connection"""
         try:
             if self.serial_conn and self.serial_conn.is_open:
-                self.serial_conn.write(b"PING\n")
-                self.serial_conn.flush()
-                time.sleep(0.3)
+                # A bare newline ends any half-received line on the Pico and
+                # gets no reply (empty lines are ignored), so nothing to wait for
+                self.serial_conn.write(b"\n")
                 self.serial_conn.reset_input_buffer()
         except:
             pass
 
+    def _write(self, data: bytes):
+        """Write straight to the tty fd - pyserial's write() adds a select() per call"""
+        try:
+            sent = os.write(self.serial_conn.fileno(), data)
+        except (BlockingIOError, AttributeError):
+            sent = 0  # TX buffer full, or a port without a plain fd
+        if sent < len(data):
+            self.serial_conn.write(data[sent:])
+
+    def _enable_low_latency(self):
+        """Drop the kernel's 16ms RX coalescing on USB serial adapters (best effort)"""
+        try:
+            self.serial_conn.set_low_latency_mode(True)
+            return
+        except (IOError, ValueError, AttributeError):
+            pass
+        
+        # Fallback for usb-serial drivers (FTDI etc.) - needs write access
+        tty = os.path.basename(os.path.realpath(self.port))
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{tty}/latency_timer", "w") as f:
+                f.write("1")
+        except OSError:
+            pass
+
+    def _start_reader(self):
+        """Start the serial reader thread"""
+        self.responses = queue.Queue(maxsize=self.RESPONSE_QUEUE_SIZE)
+        self._estop_pending = self._estop_m5_replies = 0
+        self.reader_running = True
+        self.reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+        self.reader_thread.start()
+
+    def _stop_reader(self):
+        """Stop the reader thread and close the port"""
+        self.reader_running = False
+        if self.serial_conn and self.serial_conn.is_open:
+            self.serial_conn.cancel_read()  # Wake the reader out of select()
+        if self.reader_thread:
+            self.reader_thread.join(timeout=1)
+            self.reader_thread = None
+        if self.serial_conn and self.serial_conn.is_open:
+            self.serial_conn.close()
+
+    def _reader_loop(self):
+        """Read from the Pico in chunks into one reused buffer and split out lines"""
+        buf = bytearray(self.RX_BUFFER_SIZE)
+        view = memoryview(buf)
+        pos = 0
+        
+        while self.reader_running:
+            try:
+                # Block for the first byte, then take everything already waiting
+                # (readline() would do a read()+select() per byte)
+                want = max(1, min(self.serial_conn.in_waiting, len(buf) - pos))
+                n = self.serial_conn.readinto(view[pos:pos + want])
+            except Exception:
+                break  # Port closed
+            
+            if not n:
+                continue  # cancel_read()
+            pos += n
+            
+            start = 0
+            while True:
+                nl = buf.find(b"\n", start, pos)
+                if nl < 0:
+                    break
+                self._handle_line(str(view[start:nl], "utf-8", "ignore").strip())
+                start = nl + 1
+            
+            # Keep the partial line for the next read
+            if start:
+                buf[:pos - start] = bytes(view[start:pos])
+                pos -= start
+            elif pos == len(buf):
+                pos = 0  # No newline in a full buffer - drop the garbage
+
+    def _handle_line(self, line: str):
+        """Route one line - STREAM: pushes update status, the rest are replies"""
+        if not line:
+            return
+        
+        if line.startswith("STREAM:"):
+            self._handle_stream_line(line)
+        else:
+            if self._discard_estop_reply(line):
+                return
+            try:
+                self.responses.put_nowait(line)
+            except queue.Full:
+                # Never block the reader - drop the oldest unclaimed reply
+                try:
+                    self.responses.get_nowait()
+                except queue.Empty:
+                    pass
+                self.responses.put_nowait(line)
+
+    def _discard_estop_reply(self, line: str) -> bool:
+        """True if line answers emergency_stop's M112/M5 rather than a waiting command"""
+        with self._discard_lock:
+            if not (self._estop_pending or self._estop_m5_replies):
+                return False
+            if time.monotonic() > self._estop_deadline:
+                # Pico never answered (halted or resetting) - stop filtering
+                self._estop_pending = self._estop_m5_replies = 0
+                return False
+            if self._estop_m5_replies:
+                self._estop_m5_replies -= 1
+                return True
+            if line == self.ESTOP_REPLY:
+                # Replies to commands already in flight came before this and
+                # were passed on; the M5 written with the M112 answers next
+                self._estop_pending -= 1
+                self._estop_m5_replies += 1
+                return True
+            return False
+
+    def _handle_stream_line(self, line: str):
+        """Apply a pushed status line and notify callbacks"""
+        self._parse_status_response(line)
+        self.last_status_line = line
+        self.last_status_time = time.monotonic()
+        status = {"status": line}
+        for callback in self.status_callbacks:
+            try:
+                callback(status)
+            except:
+                pass
+
+    def _set_stream(self, interval_ms: int) -> bool:
+        """Ask the Pico to push status every interval_ms (0 = off)"""
+        response = self.send_command(f"STREAM P{interval_ms}")
+        return bool(response and response.startswith("OK"))
+
     def _test_connection(self) -> bool:
         """Test connection with multiple ping attempts"""
-        for attempt in range(3):
+        for attempt in range(self.PING_ATTEMPTS):
             try:
-                response = self.send_command("PING")
+                response = self.send_command("PING", timeout=self.PING_TIMEOUT_S)
                 if response and "PONG" in str(response):
                     print(f"✅ Connection test successful (attempt {attempt + 1})")
                     return True
                 else:
                     print(f"⚠️ Ping attempt {attempt + 1} failed: {response}")
-                    time.sleep(0.5)
             except:
-                time.sleep(0.5)
+                pass
         
         print("❌ Failed to connect to Pico")
         return False
 
     def send_command(self, command: str, timeout: float = 2.0) -> Optional[str]:
         """Send command and get response"""
+        return self.send_commands([command], timeout)[0]
+
+    def send_commands(self, commands: List[str], timeout: float = 2.0) -> List[Optional[str]]:
+        """Send several commands in a single write and get one response per command"""
         if not self.serial_conn or not self.serial_conn.is_open:
-            return None
+            return [None] * len(commands)
         
-        try:
-            # Clear input buffer
-            self.serial_conn.reset_input_buffer()
-            
-            # Send command
-            self.serial_conn.write(f"{command}\n".encode())
-            self.serial_conn.flush()
-            
-            # Wait for response
-            time.sleep(0.3)
-            
-            # Read response with timeout
-            start_time = time.time()
-            response = ""
-            
-            while time.time() - start_time < timeout:
-                if self.serial_conn.in_waiting > 0:
-                    response = self.serial_conn.read(self.serial_conn.in_waiting).decode().strip()
-                    break
-                time.sleep(0.01)
-            
-            if not response:
-                print(f"⚠️ No response to command: {command}")
-                return None
+        with self.command_lock:
+            try:
+                # Drop stale replies (e.g. from a timed-out command)
+                while not self.responses.empty():
+                    self.responses.get_nowait()
                 
-            # Parse STATUS responses automatically
-            if response.startswith("STATUS:"):
-                self._parse_status_response(response)
+                # Send all commands as one USB/UART transfer. No flush(): that is
+                # tcdrain(), and the reply can't arrive before the bytes go out anyway
+                self._write(b"".join(_encode_command(cmd) for cmd in commands))
                 
-            return response
-            
-        except Exception as e:
-            print(f"❌ Command error: {e}")
-            return None
+                # Wait for the reader thread to hand us the replies, in order
+                responses = []
+                for command in commands:
+                    try:
+                        response = self.responses.get(timeout=timeout)
+                    except queue.Empty:
+                        print(f"⚠️ No response to command: {command}")
+                        response = None
+                    
+                    # Parse STATUS responses automatically
+                    if response and response.startswith("STATUS:"):
+                        self._parse_status_response(response)
+                    
+                    responses.append(response)
+                    
+                return responses
+                
+            except Exception as e:
+                print(f"❌ Command error: {e}")
+                return [None] * len(commands)
 
     def _parse_status_response(self, response: str):
-        """Parse STATUS: Spindle=0.1RPM(RUN) Traverse=0.00mm Turns=123"""
+        """Parse STATUS:/STREAM: Spindle=0.1RPM(RUN) Traverse=0.00mm Turns=123 Homed=1"""
         try:
-            if "Spindle=" in response:
-                rpm_part = response.split("Spindle=")[1].split("RPM")[0]
-                self.current_rpm = float(rpm_part)
+            fields = dict(_STATUS_FIELD_RE.findall(response))
+            
+            if "Spindle" in fields:
+                self.current_rpm = float(fields["Spindle"])
+            
+            if "Traverse" in fields:
+                self.traverse_position = float(fields["Traverse"])
             
-            if "Traverse=" in response:
-                pos_part = response.split("Traverse=")[1].split("mm")[0]
-                self.traverse_position = float(pos_part)
+            if "Turns" in fields:
+                self.current_turns = int(fields["Turns"])
             
-            if "Turns=" in response:
-                turns_part = response.split("Turns=")[1].split()[0]  # Get first word after Turns=
-                self.current_turns = int(turns_part)
+            if "Homed" in fields:
+                if fields["Homed"] == "1":
+                    self.homed.set()
+                else:
+                    self.homed.clear()
         except:
             pass
 
@@ -163,19 +357,30 @@ class WindingController:
         
         # Stop spindle first if running
         self.send_command("M5")
-        time.sleep(0.2)
         
         # Send home command
         response = self.send_command("G28")
+        if not response:
+            print(f"❌ No response from Pico")
+            self.state = WindingState.ERROR
+            return False
         
-        # Accept any response as success if we got one
-        if response:
+        # Pushes sent before G28 ran are already handled, so this is safe
+        self.homed.clear()
+        
+        # Homing finishes in the background - wait for Homed=1 in the stream
+        if not self.status_running:
+            self._set_stream(self.STREAM_INTERVAL_MS)
+        homed = self.homed.wait(timeout=self.HOMING_TIMEOUT_S)
+        if not self.status_running:
+            self._set_stream(0)
+        
+        if homed:
             self.state = WindingState.IDLE
-            print("✅ Homing initiated")
-            time.sleep(2)  # Give time to home
+            print("✅ Homing complete")
             return True
         else:
-            print(f"❌ No response from Pico")
+            print(f"❌ Homing did not finish within {self.HOMING_TIMEOUT_S:.0f}s")
             self.state = WindingState.ERROR
             return False
 
@@ -202,12 +407,8 @@ class WindingController:
         """Stop winding process"""
         print("⏹️ Stopping winding...")
         
-        # ALWAYS stop spindle first
-        self.send_command("M5")
-        time.sleep(0.1)
-        
-        # Then stop winding
-        self.send_command("STOP_WIND")
+        # ALWAYS stop spindle first, then stop winding (one write, in order)
+        self.send_commands(["M5", "STOP_WIND"])
         
         # Force state
         self.state = WindingState.IDLE
@@ -219,12 +420,21 @@ class WindingController:
         """Emergency stop all operations"""
         print("🚨 Emergency stop...")
         
-        # Send emergency stop
-        self.send_command("M112")
-        time.sleep(0.1)
-        
-        # Force stop spindle
-        self.send_command("M5")
+        # Write M112 (and M5 to force the spindle off) straight out, without
+        # waiting for command_lock behind a command that may be stuck in flight.
+        # The reader drops their replies (matched by content, not count, so
+        # an in-flight command still gets its own) so they can't be matched
+        # to the next command sent
+        if self.serial_conn and self.serial_conn.is_open:
+            with self._discard_lock:
+                self._estop_pending += 1
+                self._estop_deadline = time.monotonic() + self.ESTOP_REPLY_TIMEOUT_S
+            try:
+                self._write(b"M112\nM5\n")
+            except Exception as e:
+                with self._discard_lock:
+                    self._estop_pending = max(0, self._estop_pending - 1)
+                print(f"❌ Command error: {e}")
         
         # Force state reset
         self.state = WindingState.ERROR
@@ -236,14 +446,8 @@ class WindingController:
         """Reset from emergency stop and recover from errors"""
         print("🔄 Resetting emergency stop...")
         
-        # Stop spindle first
-        self.send_command("M5")
-        time.sleep(0.1)
-        
-        # Send reset commands
-        for cmd in ["M999", "STATUS"]:
-            self.send_command(cmd)
-            time.sleep(0.1)
+        # Stop spindle first, then reset - one write, replies in order
+        self.send_commands(["M5", "M999", "STATUS"])
         
         # FORCE reset state
         self.state = WindingState.IDLE
@@ -253,13 +457,17 @@ class WindingController:
         return True
 
     def get_status(self) -> Dict[str, Any]:
-        """Get current system status"""
+        """Get current system status (latest pushed line while monitoring, else STATUS)"""
+        if (self.status_running and self.last_status_line
+                and time.monotonic() - self.last_status_time < self.STATUS_MAX_AGE_S):
+            return {"status": self.last_status_line}
+        return self.get_live_status()
+
+    def get_live_status(self) -> Dict[str, Any]:
+        """Ask the Pico for STATUS now - always a round trip, never the pushed line"""
         response = self.send_command("STATUS")
         if response:
-            try:
-                return {"status": response}
-            except:
-                return {"status": response}
+            return {"status": response}
         return {"status": "unknown"}
 
     def get_version(self) -> str:
@@ -272,34 +480,23 @@ class WindingController:
         self.status_callbacks.append(callback)
 
     def start_status_monitor(self):
-        """Start status monitoring thread"""
+        """Start status monitoring (Pico pushes STREAM: lines, no polling)"""
         if self.status_running:
             return
         
         self.status_running = True
-        self.status_thread = threading.Thread(target=self._status_monitor_loop, daemon=True)
-        self.status_thread.start()
+        if self.connected:
+            self._set_stream(self.STREAM_INTERVAL_MS)
         print("📊 Status monitoring started")
 
-    def _status_monitor_loop(self):
-        """Status monitoring loop"""
-        while self.status_running and self.connected:
-            try:
-                status = self.get_status()
-                for callback in self.status_callbacks:
-                    try:
-                        callback(status)
-                    except:
-                        pass
-                time.sleep(1)
-            except:
-                time.sleep(1)
-
     def stop_status_monitor(self):
         """Stop status monitoring"""
+        if not self.status_running:
+            return
+        
         self.status_running = False
-        if self.status_thread:
-            self.status_thread.join(timeout=1)
+        if self.connected:
+            self._set_stream(0)
 
     def get_progress(self) -> Dict[str, Any]:
         """Get current winding progress"""
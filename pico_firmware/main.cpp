@@ -153,6 +153,11 @@ int main() {
             communication_handler->update();
         }
         
+        // Push STREAM: status lines (no-op unless the host sent STREAM P<ms>)
+        if (gcode_interface) {
+            gcode_interface->update();
+        }
+        
         // Monitor queue health every second
         if (diagnostic_monitor) {
             diagnostic_monitor->update(1000);
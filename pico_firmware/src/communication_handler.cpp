@@ -95,8 +95,8 @@ void CommunicationHandler::send_response(const char* response) {
     uart_puts(PI_UART_ID, response);
     uart_puts(PI_UART_ID, "\n");
     
-    // Wait for transmission to complete
-    uart_tx_wait_blocking(PI_UART_ID);
+    // No uart_tx_wait_blocking(): the last bytes drain from the FIFO on their
+    // own, and waiting here would stall the main loop (and traverse sync)
 }
 
 void CommunicationHandler::send_error(const char* error) {
@@ -113,6 +113,18 @@ void CommunicationHandler::send_error(const char* error) {
     uart_puts(PI_UART_ID, error);
     uart_puts(PI_UART_ID, "\n");
     
-    // Wait for transmission to complete
-    uart_tx_wait_blocking(PI_UART_ID);
+    // No uart_tx_wait_blocking(): the last bytes drain from the FIFO on their
+    // own, and waiting here would stall the main loop (and traverse sync)
+}
+
+void CommunicationHandler::send_stream(const char* line) {
+    if (!initialized) return;
+    
+    // No printf echo here - this runs every stream interval
+    while (!uart_is_writable(PI_UART_ID)) {
+        tight_loop_contents();
+    }
+    
+    uart_puts(PI_UART_ID, line);
+    uart_puts(PI_UART_ID, "\n");
 }
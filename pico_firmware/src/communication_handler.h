@@ -18,6 +18,7 @@ public:
     void update(); // Call this in main loop to process incoming data
     void send_response(const char* response);
     void send_error(const char* error);
+    void send_stream(const char* line);  // Unsolicited push, no debug echo
 
 private:
     GCodeInterface* gcode_interface;
@@ -17,7 +17,7 @@
 #define PI_UART_ID uart0
 #define PI_UART_TX 1
 #define PI_UART_RX 0
-#define PI_UART_BAUD 115200
+#define PI_UART_BAUD 230400  // Must match WindingController baudrate on the Pi
 
 // =============================================================================
 // BLDC MOTOR CONFIGURATION
@@ -68,6 +68,7 @@
 
 // Traverse Lead Screw
 #define TRAVERSE_PITCH_MM      6.0f    // YOUR ACTUAL 6mm leadscrew
+#define TRAVERSE_STEPS_PER_MM   6135.0f // Calibrated: 10000 steps = 1.63mm
 #define MIN_TRAVERSE_POS_MM     0.0f    // Minimum traverse position
 #define HOMING_SPEED_MM_PER_SEC 5.0f    // Homing speed
 
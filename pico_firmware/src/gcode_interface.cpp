@@ -28,9 +28,13 @@ GCodeInterface::GCodeInterface(BLDC_MOTOR* spindle, TraverseController* traverse
     , current_command(TOKEN_UNKNOWN)
     , busy(false)
     , error_state(false)
+    , stream_interval_ms(0)
+    , last_stream_check_ms(0)
+    , last_stream_time_ms(0)
 {
     command_buffer[0] = '\0';
     last_error[0] = '\0';
+    last_stream_line[0] = '\0';
     printf("[GCodeInterface] Created with controller references\n");
 }
 
@@ -183,11 +187,11 @@ bool GCodeInterface::execute_version() {
     return true;
 }
 
-bool GCodeInterface::execute_status() {
-    char status_buffer[256];
+void GCodeInterface::format_status(char* buffer, size_t size, const char* prefix) {
     float spindle_rpm = 0.0f;
     float traverse_pos = 0.0f;
     bool spindle_running = false;
+    bool homed = false;
     uint32_t turns_completed = 0;
     
     if (spindle_controller) {
@@ -197,23 +201,102 @@ bool GCodeInterface::execute_status() {
     
     if (traverse_controller) {
         traverse_pos = traverse_controller->get_current_position();
+        homed = traverse_controller->is_homed();
     }
     
     if (winding_controller) {
         turns_completed = winding_controller->get_turns_completed();
     }
     
-    snprintf(status_buffer, sizeof(status_buffer), 
-             "STATUS: Spindle=%.1fRPM(%s) Traverse=%.2fmm Turns=%u", 
+    snprintf(buffer, size, 
+             "%s Spindle=%.1fRPM(%s) Traverse=%.2fmm Turns=%u Homed=%d", 
+             prefix,
              spindle_rpm, 
              spindle_running ? "RUN" : "STOP", 
              traverse_pos,
-             turns_completed);
-    
+             turns_completed,
+             homed ? 1 : 0);
+}
+
+bool GCodeInterface::execute_status() {
+    char status_buffer[256];
+    format_status(status_buffer, sizeof(status_buffer), "STATUS:");
     send_response(status_buffer);
     return true;
 }
 
+// =============================================================================
+// STREAM P<ms> - Push status lines instead of making the host poll STATUS
+// Lines are prefixed "STREAM:" so the host can tell them from command replies
+// =============================================================================
+bool GCodeInterface::execute_stream() {
+    if (params.has_P && params.P > 0.0f) {
+        stream_interval_ms = (uint32_t)params.P;
+        if (stream_interval_ms < 20) {
+            stream_interval_ms = 20;  // Keep UART free for command replies
+        }
+    } else {
+        stream_interval_ms = 0;
+    }
+    last_stream_line[0] = '\0';  // Force a push on the next update()
+    
+    char response[32];
+    snprintf(response, sizeof(response), "OK STREAM P%u", stream_interval_ms);
+    send_response(response);
+    return true;
+}
+
+void GCodeInterface::update() {
+    if (stream_interval_ms == 0 || !communication_handler) return;
+    
+    // Format at most once per interval - snprintf of floats is slow without an FPU
+    uint32_t now = to_ms_since_boot(get_absolute_time());
+    if (now - last_stream_check_ms < stream_interval_ms) return;
+    last_stream_check_ms = now;
+    
+    char line[sizeof(last_stream_line)];
+    format_status(line, sizeof(line), "STREAM:");
+    
+    // Only push on change, with a 1s keepalive so the host sees we're alive
+    if (strcmp(line, last_stream_line) == 0 && now - last_stream_time_ms < 1000) return;
+    
+    communication_handler->send_stream(line);
+    strcpy(last_stream_line, line);
+    last_stream_time_ms = now;
+}
+
+// =============================================================================
+// Command prefix table - scanned in order, first match wins
+// Longer names go before any shorter name that is their prefix
+// (TEST_HOME_SWITCH before TEST_HOME)
+// =============================================================================
+struct CommandToken {
+    const char* name;
+    size_t length;
+    GCodeTokenType token;
+};
+
+static const CommandToken COMMAND_TABLE[] = {
+    {"STREAM",           6,  TOKEN_STREAM},
+    {"PING",             4,  TOKEN_PING},
+    {"VERSION",          7,  TOKEN_VERSION},
+    {"STATUS",           6,  TOKEN_STATUS},
+    {"G0",               2,  TOKEN_G0},
+    {"G1",               2,  TOKEN_G1},
+    {"G28",              3,  TOKEN_G28},
+    {"M112",             4,  TOKEN_M112},
+    {"M3",               2,  TOKEN_M3},
+    {"M4",               2,  TOKEN_M4},
+    {"M5",               2,  TOKEN_M5},
+    {"M999",             4,  TOKEN_M999},
+    {"WIND",             4,  TOKEN_WIND},
+    {"STOP_WIND",        9,  TOKEN_STOP_WIND},
+    {"RESET_WINDING",    13, TOKEN_RESET_WINDING},
+    {"TEST_HOME_SWITCH", 16, TOKEN_TEST_HOME_SWITCH},
+    {"TEST_HOME",        9,  TOKEN_TEST_HOME},
+    {"TEST_STEPS",       10, TOKEN_TEST_STEPS},
+};
+
 // Minimal implementation for demonstration
 bool GCodeInterface::parse_command(const char* command) {
     if (!command || strlen(command) == 0) {
@@ -226,31 +309,23 @@ bool GCodeInterface::parse_command(const char* command) {
     
     params = GCodeParams();
     
-    // Simple token detection
-    if (strncmp(command, "PING", 4) == 0) {
-        current_command = TOKEN_PING;
-    } else if (strncmp(command, "VERSION", 7) == 0) {
-        current_command = TOKEN_VERSION;
-    } else if (strncmp(command, "STATUS", 6) == 0) {
-        current_command = TOKEN_STATUS;
-    } else if (strncmp(command, "G0", 2) == 0) {
-        current_command = TOKEN_G0;
-    } else if (strncmp(command, "G1", 2) == 0) {
-        current_command = TOKEN_G1;
-    } else if (strncmp(command, "G28", 3) == 0) {
-        current_command = TOKEN_G28;
-    } else if (strncmp(command, "M112", 4) == 0) {
-        current_command = TOKEN_M112;
-    } else if (strncmp(command, "M3", 2) == 0) {
-        current_command = TOKEN_M3;
-    } else if (strncmp(command, "M4", 2) == 0) {
-        current_command = TOKEN_M4;
-    } else if (strncmp(command, "M5", 2) == 0) {
-        current_command = TOKEN_M5;
-    } else if (strncmp(command, "M999", 4) == 0) {
-        current_command = TOKEN_M999;
-    } else if (strncmp(command, "WIND", 4) == 0) {
-        current_command = TOKEN_WIND;
+    // Table-driven token detection
+    current_command = TOKEN_UNKNOWN;
+    for (const CommandToken& entry : COMMAND_TABLE) {
+        if (command[0] == entry.name[0] && strncmp(command, entry.name, entry.length) == 0) {
+            current_command = entry.token;
+            break;
+        }
+    }
+    
+    if (current_command == TOKEN_STREAM) {
+        // Parse STREAM parameters: STREAM P100
+        const char* p_ptr = strchr(command + 6, 'P');
+        if (p_ptr) {
+            params.P = strtof(p_ptr + 1, nullptr);
+            params.has_P = true;
+        }
+    } else if (current_command == TOKEN_WIND) {
         // Parse WIND parameters: WIND T1000 S300
         char* cmd_ptr = (char*)command + 4; // Skip "WIND"
         while (*cmd_ptr == ' ' || *cmd_ptr == '\t') cmd_ptr++; // Skip whitespace
@@ -289,18 +364,6 @@ bool GCodeInterface::parse_command(const char* command) {
                 cmd_ptr++;
             }
         }
-    } else if (strncmp(command, "STOP_WIND", 9) == 0) {
-        current_command = TOKEN_STOP_WIND;
-    } else if (strncmp(command, "RESET_WINDING", 13) == 0) {
-        current_command = TOKEN_RESET_WINDING;
-    } else if (strncmp(command, "TEST_HOME", 9) == 0) {
-        current_command = TOKEN_TEST_HOME;
-    } else if (strncmp(command, "TEST_STEPS", 10) == 0) {
-        current_command = TOKEN_TEST_STEPS;
-    } else if (strncmp(command, "TEST_HOME_SWITCH", 16) == 0) {
-        current_command = TOKEN_TEST_HOME_SWITCH;
-    } else {
-        current_command = TOKEN_UNKNOWN;
     }
     
     // Parse parameters (simplified)
@@ -330,6 +393,8 @@ bool GCodeInterface::execute_command() {
             return execute_version();
         case TOKEN_STATUS:
             return execute_status();
+        case TOKEN_STREAM:
+            return execute_stream();
         case TOKEN_G0:
         case TOKEN_G1:
             return execute_g0_g1();
@@ -56,6 +56,7 @@ enum GCodeTokenType {
     TOKEN_TEST_HOME = 39,     // Test home switch
     TOKEN_TEST_STEPS = 40,    // Test steps for calibration
     TOKEN_TEST_HOME_SWITCH = 41,  // Test home switch state
+    TOKEN_STREAM = 42,        // Periodic status push (STREAM P<ms>, P0 = off)
     TOKEN_UNKNOWN = 255
 };
 
@@ -100,6 +101,7 @@ public:
     bool parse_command(const char* command);
     bool execute_command();
     void process_command(const char* command);  // Combined parse + execute
+    void update();  // Call in main loop - pushes STREAM: status lines when enabled
     
     // Communication setup
     void set_communication_handler(CommunicationHandler* comm_handler);
@@ -136,6 +138,12 @@ private:
     bool busy;
     bool error_state;
     
+    // Status streaming (STREAM command)
+    uint32_t stream_interval_ms;
+    uint32_t last_stream_check_ms;  // Last time the status line was formatted
+    uint32_t last_stream_time_ms;   // Last time a line was pushed (keepalive)
+    char last_stream_line[128];
+    
     // Token-based parsing (from Code-snippets improvement)
     GCodeTokenType parse_token(const char* command);
     bool parse_parameters_tokenized(const char* cmd);
@@ -170,6 +178,7 @@ private:
     bool execute_ping();
     bool execute_version();
     bool execute_status();
+    bool execute_stream();
     bool execute_get_hall_rpm();
     bool execute_check_hall();
     
@@ -189,6 +198,7 @@ private:
     bool execute_test_home_switch();  // Test home switch state
     
     // Helper functions
+    void format_status(char* buffer, size_t size, const char* prefix);
     void log_command(const char* cmd);
     void log_error(const char* error);
 };
@@ -38,7 +38,7 @@ TraverseController::TraverseController()
     , step_interval_us(0)
     , last_step_time(0)
     , step_direction(true)
-    , steps_per_mm(6135.0f)  // 6135 steps/mm (calibrated value)
+    , steps_per_mm(TRAVERSE_STEPS_PER_MM)  // 6135 steps/mm (calibrated value)
     , microsteps(TRAVERSE_MICROSTEPS)
 {
     instance = this;
@@ -84,8 +84,8 @@ void TraverseController::init() {
     // Calculate steps per mm - based on original calibration
     // Original calibration: 10000 steps = 1.63mm
     // So: steps_per_mm = 10000 / 1.63 = 6135 steps/mm
-    steps_per_mm = 10000.0f / 1.63f;  // Based on original calibration
-    printf("[TraverseController] Steps per mm calculation: 10000 / 1.63 = %.1f (original calibration)\n", steps_per_mm);
+    // (TRAVERSE_STEPS_PER_MM in config.h - shared with WindingController's sync)
+    printf("[TraverseController] Steps per mm: %.1f (original calibration 10000 / 1.63)\n", steps_per_mm);
     
     printf("[TraverseController] Initialized - Steps/mm: %.1f\n", steps_per_mm);
 }
@@ -187,7 +187,7 @@ void TraverseController::back_off_from_switch() {
     printf("[TraverseController] Phase 2: Backing off from home switch...\n");
     gpio_put(dir_pin, 1);  // Move away from home (opposite of homing direction)
     step_direction = true;
-    steps_remaining = 49080;  // Back off exactly 8mm (8 * 6135 = 49080 steps)
+    steps_remaining = (int32_t)(8.0f * TRAVERSE_STEPS_PER_MM);  // Back off exactly 8mm (49080 steps)
     current_speed_mm_per_sec = 10.0f;  // Faster back-off speed
     calculate_step_interval();
     moving = true;
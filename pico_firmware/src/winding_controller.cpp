@@ -20,6 +20,10 @@ extern TraverseController* traverse_controller;
 #define WIRE_TENSION_FACTOR 0.95f  // 5% compression for tight winding
 #endif
 
+#ifndef RAMP_RPM_STEP
+#define RAMP_RPM_STEP 5.0f  // Spindle ramp resolution - PWM only updated per step
+#endif
+
 #ifndef TRAVERSE_MIN_WINDING_SPEED
 #define TRAVERSE_MIN_WINDING_SPEED 1000.0f  // steps/sec
 #endif
@@ -37,6 +41,7 @@ WindingController::WindingController(MoveQueue* mq, BLDC_MOTOR* spindle_motor)
     , current_traverse_position_mm(0.0f)
     , ramp_started(false)
     , ramp_start_time(0)
+    , ramp_applied_rpm(-1.0f)
     , initial_sync_done(false)
     , initial_revolutions(0.0f)
     , turn_accum(0.0)
@@ -44,9 +49,11 @@ WindingController::WindingController(MoveQueue* mq, BLDC_MOTOR* spindle_motor)
     , traverse_steps_emitted(0.0)
     , enc_last_sync(0)
     , enc_last_rpm(0)
+    , sync_steps_per_sec(0.0f)
 
 {
     printf("[WindingController] Created with spindle motor\n");
+    update_sync_rate();
 }
 
 void WindingController::init() {
@@ -63,11 +70,10 @@ void WindingController::init() {
 void WindingController::set_parameters(const WindingParams& p) {
     params = p;
     
-    // Calculate derived parameters
-    params.wire_pitch_mm = params.wire_diameter_mm;
-    params.turns_per_layer = (uint32_t)(params.layer_width_mm / params.wire_pitch_mm);
-    if (params.turns_per_layer == 0) params.turns_per_layer = 1;
-    params.total_layers = (params.target_turns + params.turns_per_layer - 1) / params.turns_per_layer;
+    // Calculate derived parameters once here - the winding loop only reads them
+    params.calculate_layers();
+    
+    update_sync_rate();
     
     printf("Parameters set: %u turns, %.1f RPM, %.3fmm wire\n", 
            params.target_turns, params.spindle_rpm, params.wire_diameter_mm);
@@ -274,6 +280,7 @@ void WindingController::ramp_up_spindle() {
                params.spindle_rpm, params.ramp_time_sec);
         ramp_started = true;
         ramp_start_time = time_us_32();
+        ramp_applied_rpm = -1.0f;
         
         // ⭐ ACTIVATE PIO MODE for high-speed stepping during winding
         if (move_queue) {
@@ -304,11 +311,19 @@ void WindingController::ramp_up_spindle() {
     if (ramp_progress > 1.0f) ramp_progress = 1.0f;
     
     float current_target_rpm = params.spindle_rpm * ramp_progress;
+    // Step in RAMP_RPM_STEP increments (exact target at the end) so the PWM - and
+    // set_rpm_pwm()'s printf - is only touched when the value changes, not every loop.
+    // Never round above the target (e.g. 302.7 -> 305 for a 303 RPM job)
+    if (ramp_progress < 1.0f) {
+        current_target_rpm = fminf(roundf(current_target_rpm / RAMP_RPM_STEP) * RAMP_RPM_STEP,
+                                   params.spindle_rpm);
+    }
     current_rpm = current_target_rpm;
     
     // ⭐ CRITICAL FIX: Actually apply the RPM to the motor (was missing!)
-    if (spindle_motor) {
+    if (spindle_motor && current_target_rpm != ramp_applied_rpm) {
         spindle_motor->set_rpm_pwm(current_target_rpm);
+        ramp_applied_rpm = current_target_rpm;
     }
     
     // ⭐ CRITICAL FIX: Start traverse movement during ramp-up so it syncs from the start
@@ -326,6 +341,7 @@ void WindingController::ramp_down_spindle() {
     if (!ramp_started) {
         ramp_started = true;
         ramp_start_time = time_us_32();
+        ramp_applied_rpm = -1.0f;
     }
     
     uint32_t elapsed = time_us_32() - ramp_start_time;
@@ -334,11 +350,16 @@ void WindingController::ramp_down_spindle() {
     if (ramp_progress > 1.0f) ramp_progress = 1.0f;
     
     float target_rpm = params.spindle_rpm * (1.0f - ramp_progress);
+    if (ramp_progress < 1.0f) {
+        target_rpm = fminf(roundf(target_rpm / RAMP_RPM_STEP) * RAMP_RPM_STEP,
+                           params.spindle_rpm);
+    }
     current_rpm = target_rpm;
     
-    // Actually set the spindle RPM
-    if (spindle_motor) {
+    // Actually set the spindle RPM (only when the ramp step changed)
+    if (spindle_motor && target_rpm != ramp_applied_rpm) {
         spindle_motor->set_rpm_pwm(target_rpm);
+        ramp_applied_rpm = target_rpm;
     }
     
     if (target_rpm <= 0.0f) {
@@ -368,7 +389,7 @@ void WindingController::sync_traverse_to_spindle() {
     }
     
     // Calibrated steps per mm
-    const float steps_per_mm = 6135.0f;
+    const float steps_per_mm = TRAVERSE_STEPS_PER_MM;
     
     // ⭐ CRITICAL: Check for layer edge and reverse direction if needed
     // ⚠️ SAFETY: Always check edges (even if queue is full) to prevent missing reversals
@@ -528,9 +549,6 @@ void WindingController::sync_traverse_to_spindle() {
     if (temp_delay > 2000000) temp_delay = 2000000; // Maximum 2 seconds
     uint32_t effective_delay = (uint32_t)temp_delay;
 
-    // Debug effective delay
-    printf("[SYNC] Queue: %u/256 Delay: %.1fms\n", queue_depth, effective_delay / 1000.0f);
-
     // Debug PID operation - reduced frequency to avoid spam
     static uint32_t pid_debug_counter = 0;
     if ((pid_debug_counter++ % 200) == 0) {  // Every 200th PID calculation
@@ -550,21 +568,9 @@ void WindingController::sync_traverse_to_spindle() {
     // Calculate current traverse velocity based on current RPM
     // current_rpm already declared above
     
-    // Calculate required traverse velocity: TARGET RPM × wire_diameter
-    // ⭐ CRITICAL FIX: Use target RPM, not measured RPM for correct synchronization
-    float required_traverse_velocity_mm_per_min = params.spindle_rpm * params.wire_diameter_mm;
-    float required_traverse_velocity_mm_per_sec = required_traverse_velocity_mm_per_min / 60.0f;
-
-    // Convert to steps per second
-    float required_steps_per_sec = required_traverse_velocity_mm_per_sec * steps_per_mm;
-
-    // ⭐ SAFETY: Cap traverse speed to reasonable limits
-    // Allow higher speed for testing - the motor can handle more than 1200 steps/sec
-    const float MAX_TRAVERSE_STEPS_PER_SEC = 40000.0f;  // Higher limit for testing
-    if (required_steps_per_sec > MAX_TRAVERSE_STEPS_PER_SEC) {
-        required_steps_per_sec = MAX_TRAVERSE_STEPS_PER_SEC;
-        printf("[SYNC] ⚠️ Capped traverse speed to %.0f steps/sec\n", MAX_TRAVERSE_STEPS_PER_SEC);
-    }
+    // Required traverse velocity only depends on the parameters - precomputed
+    // in update_sync_rate() (TARGET RPM × wire_diameter, capped)
+    float required_steps_per_sec = sync_steps_per_sec;
     
     // Only move if we have meaningful velocity
     if (required_steps_per_sec < 1.0f) {
@@ -575,11 +581,6 @@ void WindingController::sync_traverse_to_spindle() {
 
     int32_t steps_to_generate = (int32_t)(required_steps_per_sec * delta_time_sec);
 
-    // DEBUG: Check if we're generating steps
-    static uint32_t step_gen_count = 0;
-    printf("[SYNC] DEBUG: RPM: %.0f, required: %.0f, delta_t: %.3fs, steps: %d\n",
-           current_rpm, required_steps_per_sec, delta_time_sec, steps_to_generate);
-
     if (steps_to_generate > 0) {
         // Apply direction
         if (!traverse_direction) {
@@ -654,6 +655,27 @@ void WindingController::sync_traverse_to_spindle() {
     }
 }
 
+// =============================================================================
+// update_sync_rate() - Traverse step rate for the current parameters
+// =============================================================================
+void WindingController::update_sync_rate() {
+    // Calculate required traverse velocity: TARGET RPM × wire_diameter
+    // ⭐ CRITICAL FIX: Use target RPM, not measured RPM for correct synchronization
+    float required_traverse_velocity_mm_per_min = params.spindle_rpm * params.wire_diameter_mm;
+    float required_traverse_velocity_mm_per_sec = required_traverse_velocity_mm_per_min / 60.0f;
+
+    // Convert to steps per second (calibrated steps per mm)
+    sync_steps_per_sec = required_traverse_velocity_mm_per_sec * TRAVERSE_STEPS_PER_MM;
+
+    // ⭐ SAFETY: Cap traverse speed to reasonable limits
+    // Allow higher speed for testing - the motor can handle more than 1200 steps/sec
+    const float MAX_TRAVERSE_STEPS_PER_SEC = 40000.0f;  // Higher limit for testing
+    if (sync_steps_per_sec > MAX_TRAVERSE_STEPS_PER_SEC) {
+        sync_steps_per_sec = MAX_TRAVERSE_STEPS_PER_SEC;
+        printf("[SYNC] ⚠️ Capped traverse speed to %.0f steps/sec\n", MAX_TRAVERSE_STEPS_PER_SEC);
+    }
+}
+
 // =============================================================================
 // FIXED: update_rpm() - Now properly updates the cursor variable
 // =============================================================================
@@ -668,17 +690,9 @@ void WindingController::update_rpm() {
 }
 
 void WindingController::update_display() {
-    // Send status to UART for Pi Zero
-    char status_buffer[128];
-    snprintf(status_buffer, sizeof(status_buffer), 
-             "Status: Layer %u/%u, Turns %u/%u, RPM %.1f\n", 
-             current_layer, params.total_layers, turns_completed, 
-             params.target_turns, current_rpm);
-    
-    // Send via UART (for Pi Zero)
-    for (int i = 0; status_buffer[i] != '\0'; i++) {
-        uart_putc(PI_UART_ID, status_buffer[i]);
-    }
+    // No per-turn UART write to the Pi: GCodeInterface::update() pushes a
+    // throttled STREAM: line with the turn count, and an unsolicited line here
+    // could be taken as the reply to whatever command the Pi has in flight
     
     // ⭐ PERFORMANCE: USB printf is SLOW (~1-5ms). Only print every 50 turns to reduce CPU load
     static uint32_t last_print_turn = 0;
@@ -692,12 +706,12 @@ void WindingController::update_display() {
 
 uint32_t WindingController::mm_to_steps(float mm) {
     // Use original calibrated steps per mm value
-    return (uint32_t)(mm * 6135.0f);
+    return (uint32_t)(mm * TRAVERSE_STEPS_PER_MM);
 }
 
 float WindingController::steps_to_mm(uint32_t steps) {
     // Use original calibrated steps per mm value
-    return (float)steps / 6135.0f;
+    return (float)steps / TRAVERSE_STEPS_PER_MM;
 }
 
 void WindingController::adjust_traverse_speed() {
@@ -99,6 +99,7 @@ private:
     
     bool ramp_started;
     uint32_t ramp_start_time;
+    float ramp_applied_rpm;  // Last RPM sent to the spindle during a ramp
     bool initial_sync_done;  // Track if first sync has completed
 
     float initial_revolutions;  // Revolution count at start of winding
@@ -108,12 +109,14 @@ private:
     double traverse_steps_emitted;
     int32_t enc_last_sync;
     int32_t enc_last_rpm;
+    float sync_steps_per_sec;  // Traverse rate for params, see update_sync_rate()
     
     void ramp_up_spindle();
     void execute_winding();
     void ramp_down_spindle();
     void update_rpm();
     void sync_traverse_to_spindle();
+    void update_sync_rate();
     void update_display();
     
     uint32_t mm_to_steps(float mm);
@@ -329,7 +329,7 @@ python3 pi_zero/test_uart.py
 
 Expected output:
 ```
-✅ Opened /dev/serial0 @ 115200 baud
+✅ Opened /dev/serial0 @ 230400 baud
 ✅ Received: 'PONG'
 ✅ Received: Pico_Spindle_v1.0
 ```
@@ -384,7 +384,7 @@ api.stop_spindle()
 1. **UART Communication Failed**
    - Check wiring connections
    - Verify UART is enabled in raspi-config
-   - Check baud rate (115200)
+   - Check baud rate (230400)
 
 2. **Firmware Not Responding**
    - Reflash Pico firmware
@@ -447,8 +447,8 @@ def generate_troubleshooting_guide():
 
 3. **Check Baud Rate**:
    ```python
-   # Should be 115200
-   api = GCodeAPI(baudrate=115200)
+   # Should be 230400
+   api = GCodeAPI(baudrate=230400)
    ```
 
 4. **Test Connection**:
@@ -724,7 +724,7 @@ Main API class for G-code communication with the Pico.
 from main_controller import GCodeAPI
 
 # Create API instance
-api = GCodeAPI(port='/dev/serial0', baudrate=115200)
+api = GCodeAPI(port='/dev/serial0', baudrate=230400)
 
 # Connect to Pico
 if api.connect():
@@ -4,21 +4,33 @@ Direct Pico Firmware Test Script
 Tests basic commands without web interface
 """
 
+import os
 import serial
-import time
 import sys
+import time
+
+def read_reply(ser):
+    """Read one reply line, skipping STREAM: pushes a crashed session left running"""
+    deadline = time.monotonic() + ser.timeout
+    while time.monotonic() < deadline:
+        line = ser.readline().decode().strip()
+        if not line.startswith("STREAM:"):
+            return line
+    return ""
 
 def test_pico_commands():
     """Test basic Pico commands directly"""
     
-    # Try different serial ports
-    ports_to_try = ['/dev/ttyUSB0', '/dev/ttyUSB1', '/dev/ttyACM0', '/dev/ttyACM1']
+    # Try different serial ports - only the ones that exist
+    ports_to_try = [port for port in ['/dev/ttyUSB0', '/dev/ttyUSB1', '/dev/ttyACM0', '/dev/ttyACM1']
+                    if os.path.exists(port)]
     
     for port in ports_to_try:
         try:
             print(f"\n🔍 Trying port: {port}")
-            ser = serial.Serial(port, 115200, timeout=2)
-            time.sleep(1)  # Let it settle
+            # No settle delay - the Pico doesn't reset on open, and every
+            # read below already waits up to the 2 s timeout for its reply
+            ser = serial.Serial(port, 230400, timeout=2)
             
             # Clear any existing data
             ser.reset_input_buffer()
@@ -29,43 +41,37 @@ def test_pico_commands():
             # Test 1: PING
             print("\n1. Testing PING...")
             ser.write(b"PING\n")
-            time.sleep(0.5)
-            response = ser.readline().decode().strip()
+            response = read_reply(ser)
             print(f"   Response: {response}")
             
             # Test 2: VERSION
             print("\n2. Testing VERSION...")
             ser.write(b"VERSION\n")
-            time.sleep(0.5)
-            response = ser.readline().decode().strip()
+            response = read_reply(ser)
             print(f"   Response: {response}")
             
             # Test 3: STATUS
             print("\n3. Testing STATUS...")
             ser.write(b"STATUS\n")
-            time.sleep(0.5)
-            response = ser.readline().decode().strip()
+            response = read_reply(ser)
             print(f"   Response: {response}")
             
             # Test 4: G28 (Home)
             print("\n4. Testing G28 (Home)...")
             ser.write(b"G28\n")
-            time.sleep(2)  # Give time for homing
-            response = ser.readline().decode().strip()
+            response = read_reply(ser)
             print(f"   Response: {response}")
             
             # Test 5: M5 (Stop)
             print("\n5. Testing M5 (Stop)...")
             ser.write(b"M5\n")
-            time.sleep(0.5)
-            response = ser.readline().decode().strip()
+            response = read_reply(ser)
             print(f"   Response: {response}")
             
             # Test 6: M112 (Emergency Stop)
             print("\n6. Testing M112 (Emergency Stop)...")
             ser.write(b"M112\n")
-            time.sleep(0.5)
-            response = ser.readline().decode().strip()
+            response = read_reply(ser)
             print(f"   Response: {response}")
             
             ser.close()